@@ -9,6 +9,8 @@ import build_utils.toolchain_builder as tb
 import build_utils.toolchain_args as ta
 
 
+JOBS = os.cpu_count() or 1
+
 BASE_DEPS = {
     "apt": [
         "nasm",
@@ -68,6 +70,18 @@ def get_build_dir(arch, platform, toolchain):
                         f"build-{toolchain}-{arch}-{platform}")
 
 
+def merge_dependencies(*dep_sets):
+    merged = {}
+
+    for deps in dep_sets:
+        for pm_name, pm_deps in deps.items():
+            merged.setdefault(pm_name, []).extend(pm_deps)
+
+    # Don't ask the package manager about the same package twice
+    return {pm_name: list(dict.fromkeys(pm_deps))
+            for pm_name, pm_deps in merged.items()}
+
+
 def build_toolchain(args):
     toolchain_arch = args.arch
 
@@ -89,12 +103,17 @@ def build_toolchain(args):
     tp = ta.params_from_args(args, toolchain_platform, tc_platform_root_path,
                              tc_root_path, toolchain_arch)
 
+    deps = []
     if not args.skip_base_dependencies:
-        pm.install_dependencies(BASE_DEPS)
-
+        deps.append(BASE_DEPS)
     if args.fetch_test_dependencies:
-        pm.install_dependencies(TEST_DEPS)
+        deps.append(TEST_DEPS)
 
+    # Query/install everything in one go instead of once per set
+    if deps:
+        pm.install_dependencies(merge_dependencies(*deps))
+
+    if args.fetch_test_dependencies:
         # Brew doesn't have a pytest package
         if pm.get_package_manager().name == "brew":
             subprocess.check_call(["python3", "-m", "pip", "install", "pytest"])
@@ -142,7 +161,7 @@ def build_hyper(args):
         print("Not rerunning cmake since build directory already exists "
               "(--reconfigure)")
 
-    subprocess.run(["cmake", "--build", ".", "-j", str(os.cpu_count())],
+    subprocess.run(["cmake", "--build", ".", "-j", str(JOBS)],
                    cwd=build_dir, check=True)
 
 